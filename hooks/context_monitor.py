@@ -24,16 +24,105 @@ WARN_BYTES = 640 * 1024
 CRITICAL_BYTES = 720 * 1024
 MAX_BYTES = 800 * 1024
 
+TOOL_USE_MARKER = b'"tool_use"'
+READ_CHUNK_BYTES = 64 * 1024
+CACHE_FILE = ".drive/.context_monitor_cache.json"
+
+
+def get_cache_path() -> str:
+    project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
+    return os.path.join(project_dir, CACHE_FILE)
+
+
+def load_count_cache(cache_path: str) -> dict:
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (json.JSONDecodeError, IOError, OSError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_count_cache(cache_path: str, cache: dict) -> None:
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump(cache, f)
+    except (IOError, OSError):
+        pass
+
 
 def count_tool_uses(transcript_path: str) -> int | None:
-    """Count tool_use occurrences in transcript as exchange proxy."""
+    """Count tool_use occurrences in transcript as exchange proxy.
+
+    The transcript is append-only, so the last count is cached by
+    (path, size, mtime) and only the bytes appended since then are scanned.
+    Scanning stops once MAX_EXCHANGES is reached, since usage is capped there;
+    past that point the returned count is a lower bound.
+    """
+    try:
+        st = os.stat(transcript_path)
+    except OSError:
+        return None
+
+    cache_path = get_cache_path()
+    cache = load_count_cache(cache_path)
+    start, count = 0, 0
+    if cache.get("path") == transcript_path:
+        cached_size = cache.get("size", 0)
+        cached_count = cache.get("count", 0)
+        if cached_size == st.st_size and cache.get("mtime_ns") == st.st_mtime_ns:
+            return cached_count
+        # Appending can only add markers, so a saturated count stays saturated
+        if cached_count >= MAX_EXCHANGES and cached_size < st.st_size:
+            return cached_count
+        if cached_size < st.st_size:
+            start, count = cached_size, cached_count
+
     try:
-        with open(transcript_path, "r") as f:
-            content = f.read()
-        return content.count('"tool_use"')
+        with open(transcript_path, "rb") as f:
+            # Back up so a marker straddling the old end of file is counted;
+            # a complete marker can't fit in the re-read bytes, so none is counted twice
+            f.seek(max(0, start - (len(TOOL_USE_MARKER) - 1)))
+            # Stop at the size being cached; bytes appended since the stat are
+            # left for the next run so they aren't counted twice
+            count += count_marker(f, end=st.st_size, limit=MAX_EXCHANGES - count)
     except (IOError, OSError):
         return None
 
+    save_count_cache(cache_path, {
+        "path": transcript_path,
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "count": count,
+    })
+    return count
+
+
+def count_marker(f, end: int, limit: int | None = None) -> int:
+    """Count TOOL_USE_MARKER in a binary file, reading it in fixed-size chunks.
+
+    Reads up to byte offset end and stops as soon as the count reaches limit,
+    if given.
+    """
+    count = 0
+    # Carry the tail of each chunk so a marker split across reads is still seen
+    overlap = len(TOOL_USE_MARKER) - 1
+    carry = b""
+    while True:
+        size = min(READ_CHUNK_BYTES, end - f.tell())
+        if size <= 0:
+            break
+        chunk = f.read(size)
+        if not chunk:
+            break
+        buf = carry + chunk
+        count += buf.count(TOOL_USE_MARKER)
+        if limit is not None and count >= limit:
+            break
+        carry = buf[-overlap:]
+    return count
+
 
 def get_transcript_size(transcript_path: str) -> int:
     """Get transcript file size as fallback metric."""
@@ -63,9 +152,9 @@ def compute_usage(transcript_path: str) -> float:
 
 def main() -> int:
     try:
-        raw = sys.stdin.read()
+        raw = sys.stdin.buffer.read()
         hook_input = json.loads(raw) if raw.strip() else {}
-    except (json.JSONDecodeError, IOError):
+    except (json.JSONDecodeError, UnicodeDecodeError, IOError):
         hook_input = {}
 
     transcript_path = hook_input.get("transcript_path", "")
@@ -13,10 +13,16 @@ import json
 import os
 import subprocess
 import sys
+import time
 
 SUBPROCESS_TIMEOUT = 15  # seconds per command
 MAX_ERROR_LINES = 5
 LOG_FILE = ".drive/lint-output.log"
+TSC_BUILD_INFO_DIR = ".drive/tsc"
+
+
+def get_project_dir() -> str:
+    return os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
 
 
 def ensure_log_dir(project_dir: str) -> None:
@@ -59,15 +65,29 @@ def prefix_errors(output: str) -> str:
     return "\n".join(prefixed)
 
 
+def resolve_executable(cmd: list[str]) -> list[str]:
+    """Swap argv[0] for its absolute path when found on PATH.
+
+    With an absolute path, no cwd and close_fds=False, subprocess can use
+    posix_spawn instead of fork+exec. Unresolved names are left as-is so a
+    missing tool still raises FileNotFoundError.
+    """
+    # Imported here so edits that skip checking don't pay for it
+    import shutil
+
+    return [shutil.which(cmd[0]) or cmd[0], *cmd[1:]]
+
+
 def run_cmd(cmd: list[str], cwd: str | None = None) -> tuple[int, str]:
     """Run a command and return (returncode, combined output)."""
     try:
         result = subprocess.run(
-            cmd,
+            resolve_executable(cmd),
             capture_output=True,
             text=True,
             timeout=SUBPROCESS_TIMEOUT,
             cwd=cwd,
+            close_fds=False,
         )
         output = result.stdout + result.stderr
         return result.returncode, output.strip()
@@ -77,6 +97,44 @@ def run_cmd(cmd: list[str], cwd: str | None = None) -> tuple[int, str]:
         return 0, ""  # Tool not installed, skip silently
 
 
+def run_cmds(cmds: list[list[str]], cwd: str | None = None) -> list[tuple[int, str]]:
+    """Run commands concurrently and return (returncode, combined output) for each.
+
+    Same result semantics as run_cmd; all commands share one timeout window.
+    """
+    procs: list[subprocess.Popen | None] = []
+    for cmd in cmds:
+        try:
+            procs.append(subprocess.Popen(
+                resolve_executable(cmd),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=cwd,
+                close_fds=False,
+            ))
+        except FileNotFoundError:
+            procs.append(None)  # Tool not installed, skip silently
+
+    deadline = time.monotonic() + SUBPROCESS_TIMEOUT
+    results = []
+    for cmd, proc in zip(cmds, procs):
+        if proc is None:
+            results.append((0, ""))
+            continue
+        # A process that already exited only needs its pipes drained
+        timeout = None if proc.poll() is not None else max(0, deadline - time.monotonic())
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            results.append((1, f"Command timed out after {SUBPROCESS_TIMEOUT}s: {' '.join(cmd)}"))
+            continue
+        results.append((proc.returncode, (stdout + stderr).strip()))
+    return results
+
+
 def find_project_root(filepath: str, marker: str) -> str | None:
     """Walk up from filepath to find directory containing marker file."""
     current = os.path.dirname(os.path.abspath(filepath))
@@ -94,55 +152,70 @@ def check_python(filepath: str) -> tuple[bool, str]:
     """Run ruff check and format check on a Python file."""
     errors = []
 
-    rc, out = run_cmd(["ruff", "check", filepath])
-    if rc != 0 and out:
-        errors.append(f"ruff check:\n{out}")
-
-    rc, out = run_cmd(["ruff", "format", "--check", filepath])
-    if rc != 0 and out:
-        errors.append(f"ruff format:\n{out}")
+    (check_rc, check_out), (format_rc, format_out) = run_cmds([
+        ["ruff", "check", filepath],
+        ["ruff", "format", "--check", filepath],
+    ])
+    if check_rc != 0 and check_out:
+        errors.append(f"ruff check:\n{check_out}")
+    if format_rc != 0 and format_out:
+        errors.append(f"ruff format:\n{format_out}")
 
     if errors:
         return False, "\n\n".join(errors)
     return True, ""
 
 
+def tsc_build_info_path(project_root: str) -> str | None:
+    """Per-root build info file under the project's .drive directory.
+
+    Returns None if the directory can't be created.
+    """
+    # Only TypeScript edits need this, so skip the import on every other edit
+    import hashlib
+
+    root_hash = hashlib.sha1(project_root.encode()).hexdigest()[:12]
+    build_info_dir = os.path.join(get_project_dir(), TSC_BUILD_INFO_DIR)
+    try:
+        os.makedirs(build_info_dir, exist_ok=True)
+    except OSError:
+        return None
+    return os.path.join(build_info_dir, f"{root_hash}.tsbuildinfo")
+
+
 def check_typescript(filepath: str) -> tuple[bool, str]:
-    """Run tsc --noEmit on the TypeScript project."""
+    """Run an incremental tsc --noEmit on the TypeScript project."""
     project_root = find_project_root(filepath, "tsconfig.json")
     if not project_root:
         return True, ""  # No tsconfig found, skip
 
-    rc, out = run_cmd(["npx", "tsc", "--noEmit"], cwd=project_root)
+    # Call the local binary directly to skip npx resolution, and let tsc reuse
+    # build info from the previous edit instead of re-checking the whole project
+    local_tsc = os.path.join(project_root, "node_modules", ".bin", "tsc")
+    tsc = [local_tsc] if os.path.exists(local_tsc) else ["npx", "tsc"]
+    build_info = tsc_build_info_path(project_root)
+    if build_info:
+        tsc += ["--incremental", "--tsBuildInfoFile", build_info]
+    rc, out = run_cmd([*tsc, "--noEmit"], cwd=project_root)
     if rc != 0 and out:
         return False, f"tsc --noEmit:\n{out}"
     return True, ""
 
 
 def check_rust(filepath: str) -> tuple[bool, str]:
-    """Run cargo check and clippy on the Rust project."""
+    """Run cargo clippy on the Rust project."""
     project_root = find_project_root(filepath, "Cargo.toml")
     if not project_root:
         return True, ""  # No Cargo.toml found, skip
 
-    errors = []
-
-    rc, out = run_cmd(
-        ["cargo", "check", "--message-format=short"],
-        cwd=project_root,
-    )
-    if rc != 0 and out:
-        errors.append(f"cargo check:\n{out}")
-
+    # clippy runs the full cargo check pass before linting, so a separate
+    # cargo check would only repeat the same compile
     rc, out = run_cmd(
         ["cargo", "clippy", "--message-format=short", "--", "-D", "warnings"],
         cwd=project_root,
     )
     if rc != 0 and out:
-        errors.append(f"cargo clippy:\n{out}")
-
-    if errors:
-        return False, "\n\n".join(errors)
+        return False, f"cargo clippy:\n{out}"
     return True, ""
 
 
@@ -164,15 +237,14 @@ def should_skip(filepath: str) -> bool:
     _, ext = os.path.splitext(filepath)
     if ext in SKIP_EXTENSIONS:
         return True
-    parts = filepath.replace("\\", "/").split("/")
-    return any(d in SKIP_DIRS for d in parts)
+    return not SKIP_DIRS.isdisjoint(filepath.replace("\\", "/").split("/"))
 
 
 def main() -> int:
     try:
-        raw = sys.stdin.read()
+        raw = sys.stdin.buffer.read()
         hook_input = json.loads(raw) if raw.strip() else {}
-    except (json.JSONDecodeError, IOError):
+    except (json.JSONDecodeError, UnicodeDecodeError, IOError):
         hook_input = {}
 
     tool_input = hook_input.get("tool_input", {})
@@ -196,7 +268,7 @@ def main() -> int:
         return 0
 
     if not ok:
-        project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
+        project_dir = get_project_dir()
 
         # Log full output to file
         log_full_output(project_dir, filepath, errors)
@@ -12,62 +12,62 @@ Output: Status messages to stderr
 
 import json
 import os
+import shutil
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 
 CONFIG_FILE = ".drive/config.json"
 PROGRESS_FILE = ".drive/claude-progress.txt"
+NOT_A_REPO_EXIT = 128
+
+# An absolute path with close_fds=False and no cwd lets subprocess use
+# posix_spawn instead of fork+exec, hence `git -C` below
+GIT = shutil.which("git") or "git"
 
 
 def get_project_dir() -> str:
     return os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
 
 
-def is_git_repo(project_dir: str) -> bool:
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            cwd=project_dir,
-        )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False
+def parse_porcelain_paths(output: str) -> set[str]:
+    """Extract paths from `git status --porcelain=v1 -z` output."""
+    paths = set()
+    entries = iter(output.split("\0"))
+    for entry in entries:
+        if len(entry) < 4:
+            continue
+        status, path = entry[:2], entry[3:]
+        paths.add(path)
+        # Renames and copies are followed by a separate field with the source path
+        if "R" in status or "C" in status:
+            next(entries, None)
+    return paths
 
 
 def auto_commit(project_dir: str) -> tuple[bool, int, str]:
     """Commit tracked file changes. Returns (committed, file_count, summary)."""
-    if not is_git_repo(project_dir):
-        return False, 0, "not a git repo"
-
-    # Check for changes to tracked files
+    # Check for staged and unstaged changes to tracked files in one call
     try:
-        diff_result = subprocess.run(
-            ["git", "diff", "--name-only"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            cwd=project_dir,
-        )
-        staged_result = subprocess.run(
-            ["git", "diff", "--name-only", "--cached"],
+        status_result = subprocess.run(
+            [GIT, "-C", project_dir, "status", "--porcelain=v1", "-z", "--untracked-files=no"],
             capture_output=True,
             text=True,
             timeout=5,
-            cwd=project_dir,
+            close_fds=False,
         )
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return False, 0, "git error"
 
-    changed_files = set()
-    if diff_result.stdout.strip():
-        changed_files.update(diff_result.stdout.strip().splitlines())
-    if staged_result.stdout.strip():
-        changed_files.update(staged_result.stdout.strip().splitlines())
+    # git exits 128 outside a work tree, so the status call doubles as the repo check
+    if status_result.returncode == NOT_A_REPO_EXIT:
+        return False, 0, "not a git repo"
+    if status_result.returncode != 0:
+        return False, 0, "git error"
+
+    changed_files = parse_porcelain_paths(status_result.stdout)
 
     if not changed_files:
         return False, 0, "no changes"
@@ -83,19 +83,21 @@ def auto_commit(project_dir: str) -> tuple[bool, int, str]:
     commit_msg = f"wip: {summary}"
 
     try:
+        # Output is never read, so don't buffer it; a failed add shows up in
+        # the commit result below
         subprocess.run(
-            ["git", "add", "-u"],
-            capture_output=True,
-            text=True,
+            [GIT, "-C", project_dir, "add", "-u"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=10,
-            cwd=project_dir,
+            close_fds=False,
         )
         result = subprocess.run(
-            ["git", "commit", "-m", commit_msg, "--no-verify"],
+            [GIT, "-C", project_dir, "commit", "-m", commit_msg, "--no-verify"],
             capture_output=True,
             text=True,
             timeout=10,
-            cwd=project_dir,
+            close_fds=False,
         )
         if result.returncode == 0:
             return True, file_count, summary
@@ -128,7 +130,7 @@ def load_config(project_dir: str) -> dict | None:
 
 
 def send_telegram(config: dict, message: str) -> None:
-    """Send message via Telegram bot API using curl. Fails silently."""
+    """Send message via Telegram bot API. Fails silently."""
     tg = config.get("telegram", {})
     if not tg.get("enabled"):
         return
@@ -138,40 +140,51 @@ def send_telegram(config: dict, message: str) -> None:
     if not bot_token or not chat_id:
         return
 
+    # Imported here since urllib pulls in ssl, which every Stop would pay for
+    # even with Telegram disabled
+    import http.client
+    import urllib.parse
+    import urllib.request
+
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+    data = urllib.parse.urlencode({
+        "chat_id": chat_id,
+        "text": message,
+        "parse_mode": "Markdown",
+    }).encode()
     try:
-        subprocess.run(
-            [
-                "curl", "-s", "-X", "POST", url,
-                "-d", f"chat_id={chat_id}",
-                "-d", f"text={message}",
-                "-d", "parse_mode=Markdown",
-            ],
-            capture_output=True,
-            timeout=10,
-        )
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+        with urllib.request.urlopen(url, data=data, timeout=10) as response:
+            response.read()
+    except (OSError, http.client.HTTPException, ValueError):
         pass
 
 
 def main() -> int:
-    # Consume stdin
-    try:
-        sys.stdin.read()
-    except IOError:
-        pass
+    # The input is unused, so stdin is left unread. Stop payloads are a few
+    # small fields that fit in the pipe buffer, so the writer isn't blocked
 
     project_dir = get_project_dir()
 
-    # Step 1: Auto-commit
-    committed, file_count, summary = auto_commit(project_dir)
+    # Step 1: Auto-commit. The progress check and config read don't depend on
+    # git, so they run while the commit is in flight. A plain thread is enough;
+    # subprocess already imports threading, while concurrent.futures costs ~6 ms
+    commit_result = []
+    commit_thread = threading.Thread(
+        target=lambda: commit_result.append(auto_commit(project_dir)),
+    )
+    commit_thread.start()
+    progress_updated = check_progress_updated(project_dir)
+    config = load_config(project_dir)
+    commit_thread.join()
+    committed, file_count, summary = commit_result[0]
+
     if committed:
         print(f"[SESSION END] Auto-committed {file_count} file(s): {summary}", file=sys.stderr)
     elif file_count > 0:
         print(f"[SESSION END] Commit skipped: {summary}", file=sys.stderr)
 
     # Step 2: Progress reminder
-    if not check_progress_updated(project_dir):
+    if not progress_updated:
         print(
             "[SESSION END] Progress file not updated this session. "
             "Consider appending a session block to .drive/claude-progress.txt",
@@ -179,7 +192,6 @@ def main() -> int:
         )
 
     # Step 3: Telegram notification
-    config = load_config(project_dir)
     if config and config.get("telegram", {}).get("enabled"):
         project_name = config.get("project_name", "Unknown Project")
         if committed:
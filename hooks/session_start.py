@@ -14,14 +14,32 @@ Output: Context injected to stdout, instructions to stderr
 import json
 import os
 import random
-import re
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 from datetime import datetime, timezone
 
 CONFIG_FILE = ".drive/config.json"
 CONTINUATION_FILE = ".drive/sessions/continuation.md"
 PROGRESS_FILE = ".drive/claude-progress.txt"
+TELEGRAM_OFFSET_FILE = ".drive/sessions/.telegram_offset"
+GIT_LOG_CACHE_FILE = ".drive/.git_log_cache.json"
+TELEGRAM_UPDATE_LIMIT = 50
+REPLY_FLUSH_TIMEOUT = 2  # seconds
+# First tail size tried when looking for the last 2 session blocks; doubled
+# until both are found or the whole file is read
+PROGRESS_TAIL_BYTES = 64 * 1024
+SESSION_MARKER = "\n## Session "
+
+# An absolute path with close_fds=False and no cwd lets subprocess use
+# posix_spawn instead of fork+exec, hence `git -C` below
+GIT = shutil.which("git") or "git"
+
+# Telegram replies still in flight; joined (with a cap) before main returns
+_pending_replies: list[threading.Thread] = []
 
 
 def get_project_dir() -> str:
@@ -44,20 +62,81 @@ def env_summary(project_dir: str) -> str:
             break
 
     # Recent git log
+    log = recent_git_log(project_dir)
+    if log:
+        lines.append(f"[SESSION INIT] Recent commits:\n{log}")
+
+    return "\n".join(lines)
+
+
+def git_log_cache_key(project_dir: str) -> list | None:
+    """Identify the current tip from HEAD and ref files, without running git.
+
+    Returns None when the tip can't be read that way, in which case the log
+    isn't cached: .git isn't a plain directory (worktrees, submodules,
+    subdirectories of a repo), the repo uses the reftable backend, or the
+    ref is neither a loose file nor in packed-refs.
+    """
+    git_dir = os.path.join(project_dir, ".git")
+    # With reftable, HEAD is a fixed stub and refs live in binary tables
+    if os.path.isdir(os.path.join(git_dir, "reftable")):
+        return None
+    try:
+        with open(os.path.join(git_dir, "HEAD")) as f:
+            head = f.read().strip()
+    except OSError:
+        return None
+
+    key: list = [head]
+    if head.startswith("ref: "):
+        # A loose ref holds the tip sha; packed refs only change with the file
+        try:
+            with open(os.path.join(git_dir, head[len("ref: "):])) as f:
+                key.append(f.read().strip())
+        except OSError:
+            try:
+                st = os.stat(os.path.join(git_dir, "packed-refs"))
+            except OSError:
+                return None
+            key.extend([st.st_mtime_ns, st.st_size])
+    return key
+
+
+def recent_git_log(project_dir: str) -> str | None:
+    """Return `git log --oneline -5`, reusing the cached output while the tip is unchanged."""
+    cache_path = os.path.join(project_dir, GIT_LOG_CACHE_FILE)
+    key = git_log_cache_key(project_dir)
+    if key is not None:
+        try:
+            with open(cache_path) as f:
+                cache = json.load(f)
+            if cache.get("key") == key:
+                return cache.get("output")
+        except (json.JSONDecodeError, IOError, OSError, AttributeError):
+            pass
+
     try:
         result = subprocess.run(
-            ["git", "log", "--oneline", "-5"],
+            [GIT, "-C", project_dir, "log", "--oneline", "-5"],
             capture_output=True,
             text=True,
             timeout=5,
-            cwd=project_dir,
+            close_fds=False,
         )
-        if result.returncode == 0 and result.stdout.strip():
-            lines.append(f"[SESSION INIT] Recent commits:\n{result.stdout.strip()}")
     except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
+        return None
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
 
-    return "\n".join(lines)
+    output = result.stdout.strip()
+    if key is not None:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, "w") as f:
+                json.dump({"key": key, "output": output}, f)
+        except (IOError, OSError):
+            pass
+    return output
 
 
 def read_progress(project_dir: str) -> str | None:
@@ -67,8 +146,7 @@ def read_progress(project_dir: str) -> str | None:
         return None
 
     try:
-        with open(path, "r") as f:
-            content = f.read().strip()
+        content = read_progress_tail(path).strip()
     except (IOError, OSError):
         return None
 
@@ -76,7 +154,8 @@ def read_progress(project_dir: str) -> str | None:
         return None
 
     # Split by session markers (lines starting with "## Session")
-    blocks = re.split(r"(?=^## Session )", content, flags=re.MULTILINE)
+    first, *rest = content.split(SESSION_MARKER)
+    blocks = [first] + [f"## Session {b}" for b in rest]
     # Filter empty blocks and take last 2
     blocks = [b.strip() for b in blocks if b.strip()]
     recent = blocks[-2:] if len(blocks) >= 2 else blocks
@@ -84,6 +163,32 @@ def read_progress(project_dir: str) -> str | None:
     return "\n\n".join(recent)
 
 
+def read_progress_tail(path: str) -> str:
+    """Read the end of the progress file, enough to hold the last 2 session blocks.
+
+    The file is append-only and grows without bound, so the tail window starts
+    at PROGRESS_TAIL_BYTES and doubles until it holds 2 session markers or
+    covers the whole file. Text before the first complete block is dropped.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        window = PROGRESS_TAIL_BYTES
+        while True:
+            offset = max(0, size - window)
+            f.seek(offset)
+            # Match text-mode newline translation, which the binary read skips
+            tail = f.read().decode("utf-8", errors="replace")
+            tail = tail.replace("\r\n", "\n").replace("\r", "\n")
+            if offset == 0:
+                return tail
+            if tail.count(SESSION_MARKER) >= 2:
+                break
+            window *= 2
+
+    start = tail.find(SESSION_MARKER)
+    return tail[start + 1:]
+
+
 def read_continuation(project_dir: str) -> str | None:
     """Read continuation file if it exists."""
     path = os.path.join(project_dir, CONTINUATION_FILE)
@@ -99,23 +204,70 @@ def read_continuation(project_dir: str) -> str | None:
     return content if content else None
 
 
-def _send_telegram_reply(bot_token: str, chat_id: str, text: str) -> None:
+def _post_telegram_reply(bot_token: str, chat_id: str, text: str) -> None:
     """Send a reply via Telegram bot API. Fails silently."""
+    import http.client
+    import urllib.parse
+    import urllib.request
+
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+    data = urllib.parse.urlencode({"chat_id": chat_id, "text": text}).encode()
     try:
-        subprocess.run(
-            [
-                "curl", "-s", "-X", "POST", url,
-                "-d", f"chat_id={chat_id}",
-                "-d", f"text={text}",
-            ],
-            capture_output=True,
-            timeout=10,
-        )
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+        with urllib.request.urlopen(url, data=data, timeout=10) as response:
+            response.read()
+    except (OSError, http.client.HTTPException, ValueError):
         pass
 
 
+def _send_telegram_reply(bot_token: str, chat_id: str, text: str) -> None:
+    """Send a reply in the background so the hook doesn't wait on the API."""
+    thread = threading.Thread(
+        target=_post_telegram_reply,
+        args=(bot_token, chat_id, text),
+        daemon=True,
+    )
+    thread.start()
+    _pending_replies.append(thread)
+
+
+def flush_telegram_replies() -> None:
+    """Give background replies up to REPLY_FLUSH_TIMEOUT to finish before exit."""
+    deadline = time.monotonic() + REPLY_FLUSH_TIMEOUT
+    for thread in _pending_replies:
+        thread.join(max(0, deadline - time.monotonic()))
+
+
+def read_telegram_offset(project_dir: str) -> int:
+    """Read the last seen update id from the sidecar file, 0 if unset."""
+    try:
+        with open(os.path.join(project_dir, TELEGRAM_OFFSET_FILE)) as f:
+            return int(f.read().strip())
+    except (IOError, OSError, ValueError):
+        return 0
+
+
+def write_atomic(path: str, content: str) -> None:
+    """Write via a temp file and os.replace so readers never see a partial file.
+
+    The temp file takes the destination's mode, so a chmod 600 config keeps it.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def poll_telegram_feedback(project_dir: str) -> list[str]:
     """Poll Telegram getUpdates for messages sent between sessions.
 
@@ -138,23 +290,30 @@ def poll_telegram_feedback(project_dir: str) -> list[str]:
 
     bot_token = tg["bot_token"]
     chat_id = str(tg["chat_id"])
-    last_update_id = tg.get("last_update_id", 0)
+    last_update_id = max(tg.get("last_update_id", 0), read_telegram_offset(project_dir))
     approved_senders: list[int] = tg.get("approved_senders", [])
     pairing_code = str(tg.get("pairing_code", ""))
     offset = last_update_id + 1 if last_update_id else 0
 
-    url = f"https://api.telegram.org/bot{bot_token}/getUpdates?offset={offset}"
+    # Imported here since urllib pulls in ssl, which every SessionStart would
+    # pay for even with Telegram disabled
+    import http.client
+    import urllib.parse
+    import urllib.request
+
+    # Short poll for plain messages only; anything past the limit is picked up
+    # next session since the offset only advances over what was returned
+    query = urllib.parse.urlencode({
+        "offset": offset,
+        "timeout": 0,
+        "limit": TELEGRAM_UPDATE_LIMIT,
+        "allowed_updates": json.dumps(["message"]),
+    })
+    url = f"https://api.telegram.org/bot{bot_token}/getUpdates?{query}"
     try:
-        result = subprocess.run(
-            ["curl", "-s", url],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode != 0:
-            return []
-        data = json.loads(result.stdout)
-    except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError):
+        with urllib.request.urlopen(url, timeout=10) as response:
+            data = json.loads(response.read())
+    except (OSError, http.client.HTTPException, ValueError):
         return []
 
     if not data.get("ok") or not data.get("result"):
@@ -201,27 +360,40 @@ def poll_telegram_feedback(project_dir: str) -> list[str]:
             )
         # else: unknown sender, wrong code — silently ignore
 
-    if max_update_id > last_update_id or config_changed:
+    # Only rewrite the full config when its contents changed; a bare offset
+    # bump (e.g. ignored messages) goes to the small sidecar file
+    if new_tasks or config_changed:
         tg["last_update_id"] = max_update_id
         config["telegram"] = tg
         try:
-            with open(config_path, "w") as f:
-                json.dump(config, f, indent=2)
-                f.write("\n")
-        except IOError:
+            write_atomic(config_path, json.dumps(config, indent=2) + "\n")
+        except OSError:
+            pass
+    if max_update_id > last_update_id:
+        try:
+            write_atomic(os.path.join(project_dir, TELEGRAM_OFFSET_FILE), f"{max_update_id}\n")
+        except OSError:
             pass
 
     return new_tasks
 
 
 def main() -> int:
-    try:
-        sys.stdin.read()
-    except IOError:
-        pass
+    # The input is unused, so stdin is left unread. SessionStart payloads are a few
+    # small fields that fit in the pipe buffer, so the writer isn't blocked
 
     project_dir = get_project_dir()
 
+    # The Telegram poll is the only step that can wait on the network, so it
+    # runs on its own thread while the local steps proceed. A plain thread is
+    # enough; subprocess already imports threading, while concurrent.futures
+    # costs ~6 ms
+    telegram_result: list[list[str]] = []
+    telegram_thread = threading.Thread(
+        target=lambda: telegram_result.append(poll_telegram_feedback(project_dir)),
+    )
+    telegram_thread.start()
+
     output_parts = []
 
     # 1. Environment summary
@@ -245,7 +417,8 @@ def main() -> int:
         )
 
     # 4. Telegram feedback polling
-    new_tasks = poll_telegram_feedback(project_dir)
+    telegram_thread.join()
+    new_tasks = telegram_result[0] if telegram_result else []
     if new_tasks:
         task_lines = "\n".join(f"- {t}" for t in new_tasks)
         output_parts.append(
@@ -271,6 +444,7 @@ def main() -> int:
         file=sys.stderr,
     )
 
+    flush_telegram_replies()
     return 0
 
 
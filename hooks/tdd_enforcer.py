@@ -8,30 +8,30 @@ Input: JSON on stdin with tool_input.file_path
 Output: stderr reminder if no test found (exit 2)
 """
 
+import functools
 import json
+import mmap
 import os
 import sys
 
 # Extensions to check for TDD compliance
-SOURCE_EXTENSIONS = {".py", ".ts", ".tsx", ".rs"}
+SOURCE_EXTENSIONS = frozenset({".py", ".ts", ".tsx", ".rs"})
 
 # Files/patterns to skip
-SKIP_EXTENSIONS = {
-    ".md", ".json", ".yaml", ".yml", ".toml", ".lock", ".env",
-    ".cfg", ".ini", ".txt", ".csv", ".html", ".css", ".scss",
-    ".svg", ".png", ".jpg", ".gif",
-}
-
-SKIP_DIRS = {
+SKIP_DIRS = frozenset({
     "node_modules", "__pycache__", ".git", ".venv", "venv",
     "dist", "build", "target", ".ruff_cache", ".mypy_cache",
     ".pytest_cache", "coverage", ".next",
-}
+})
+
+# Precomputed forms for C-level substring/suffix checks in should_skip
+SKIP_DIR_MARKERS = tuple(f"/{d}/" for d in SKIP_DIRS)
+SOURCE_SUFFIXES = tuple(SOURCE_EXTENSIONS)
 
-SKIP_FILENAMES = {
+SKIP_FILENAMES = frozenset({
     "__init__.py", "conftest.py", "setup.py", "manage.py",
     "main.py", "main.ts", "index.ts", "mod.rs", "lib.rs", "main.rs",
-}
+})
 
 
 def is_test_file(filepath: str) -> bool:
@@ -51,41 +51,53 @@ def is_test_file(filepath: str) -> bool:
 
 def should_skip(filepath: str) -> bool:
     """Check if this file should be skipped for TDD enforcement."""
-    _, ext = os.path.splitext(filepath)
-
-    if ext in SKIP_EXTENSIONS:
+    # Leading "/" so a skip dir at the start of a relative path also matches
+    norm = "/" + filepath.replace("\\", "/")
+    if any(marker in norm for marker in SKIP_DIR_MARKERS):
         return True
-    if ext not in SOURCE_EXTENSIONS:
+
+    if not norm.endswith(SOURCE_SUFFIXES):
         return True
 
     name = os.path.basename(filepath)
     if name in SKIP_FILENAMES:
         return True
 
-    parts = filepath.replace("\\", "/").split("/")
-    if any(d in SKIP_DIRS for d in parts):
-        return True
-
     if is_test_file(filepath):
         return True
 
     return False
 
 
+@functools.lru_cache(maxsize=64)
+def listdir_set(dirpath: str) -> frozenset[str]:
+    """Names in dirpath, listed once per process; empty if it isn't a directory."""
+    try:
+        return frozenset(os.listdir(dirpath or "."))
+    except OSError:
+        return frozenset()
+
+
+def any_exists(candidates: list[tuple[str, str]]) -> bool:
+    """Check (dir, filename) candidates with one listing per directory."""
+    return any(name in listdir_set(d) for d, name in candidates)
+
+
 def find_python_test(filepath: str) -> bool:
     """Look for corresponding Python test file."""
     dirpath = os.path.dirname(filepath)
+    parent = os.path.dirname(dirpath)
     name = os.path.splitext(os.path.basename(filepath))[0]
 
     candidates = [
-        os.path.join(dirpath, f"test_{name}.py"),
-        os.path.join(dirpath, f"{name}_test.py"),
-        os.path.join(dirpath, "tests", f"test_{name}.py"),
-        os.path.join(os.path.dirname(dirpath), "tests", f"test_{name}.py"),
-        os.path.join(os.path.dirname(dirpath), "tests", "unit", f"test_{name}.py"),
+        (dirpath, f"test_{name}.py"),
+        (dirpath, f"{name}_test.py"),
+        (os.path.join(dirpath, "tests"), f"test_{name}.py"),
+        (os.path.join(parent, "tests"), f"test_{name}.py"),
+        (os.path.join(parent, "tests", "unit"), f"test_{name}.py"),
     ]
 
-    return any(os.path.exists(c) for c in candidates)
+    return any_exists(candidates)
 
 
 def find_typescript_test(filepath: str) -> bool:
@@ -95,34 +107,41 @@ def find_typescript_test(filepath: str) -> bool:
     # Remove .test/.spec if already in name
     base = base.replace(".test", "").replace(".spec", "")
 
+    dirs = [
+        dirpath,
+        os.path.join(dirpath, "__tests__"),
+        os.path.join(os.path.dirname(dirpath), "__tests__"),
+    ]
     exts = [".test.ts", ".spec.ts", ".test.tsx", ".spec.tsx"]
-    candidates = []
-    for ext in exts:
-        candidates.append(os.path.join(dirpath, f"{base}{ext}"))
-        candidates.append(os.path.join(dirpath, "__tests__", f"{base}{ext}"))
-        candidates.append(os.path.join(os.path.dirname(dirpath), "__tests__", f"{base}{ext}"))
+    candidates = [(d, f"{base}{ext}") for d in dirs for ext in exts]
 
-    return any(os.path.exists(c) for c in candidates)
+    return any_exists(candidates)
 
 
 def find_rust_test(filepath: str) -> bool:
     """Check for Rust tests: inline #[cfg(test)] or tests/ directory."""
-    # Check for inline tests in the file itself
+    # Check for inline tests in the file itself, searching the mapped file
+    # rather than reading it into memory
     try:
-        with open(filepath, "r") as f:
-            content = f.read()
-            if "#[cfg(test)]" in content:
-                return True
-    except (IOError, OSError):
+        with open(filepath, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size:  # mmap rejects empty files
+                with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(b"#[cfg(test)]") != -1:
+                        return True
+    except (IOError, OSError, ValueError):
         pass
 
     # Check for tests/ directory near Cargo.toml
     dirpath = os.path.dirname(filepath)
     current = dirpath
     for _ in range(5):  # Walk up max 5 levels
-        cargo_path = os.path.join(current, "Cargo.toml")
-        tests_dir = os.path.join(current, "tests")
-        if os.path.exists(cargo_path) and os.path.isdir(tests_dir):
+        names = listdir_set(current)
+        if (
+            "Cargo.toml" in names
+            and "tests" in names
+            and os.path.isdir(os.path.join(current, "tests"))
+        ):
             return True
         parent = os.path.dirname(current)
         if parent == current:
@@ -134,9 +153,9 @@ def find_rust_test(filepath: str) -> bool:
 
 def main() -> int:
     try:
-        raw = sys.stdin.read()
+        raw = sys.stdin.buffer.read()
         hook_input = json.loads(raw) if raw.strip() else {}
-    except (json.JSONDecodeError, IOError):
+    except (json.JSONDecodeError, UnicodeDecodeError, IOError):
         hook_input = {}
 
     # Extract file path from tool input